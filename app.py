@@ -51,9 +51,20 @@ async def migrate(request: Request):
     if data.get("rocketLabel"):
         cmd.extend(["--rocket-label", data.get("rocketLabel")])
     
+    if data.get("sourceSsh"):
+        cmd.extend(["--source-ssh", data.get("sourceSsh")])
+    if data.get("sourcePath"):
+        cmd.extend(["--source-path", data.get("sourcePath")])
+    if data.get("deltaPasses") not in (None, ""):
+        cmd.extend(["--delta-passes", str(data.get("deltaPasses"))])
+    if data.get("deltaInterval") not in (None, ""):
+        cmd.extend(["--delta-interval", str(data.get("deltaInterval"))])
+    
     # Optional flags
     if data.get("visual"):
         cmd.append("--visual")
+    if data.get("deltaFreeze"):
+        cmd.append("--delta-freeze")
 
     async def stream_logs():
         try:
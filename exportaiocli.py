@@ -8,7 +8,9 @@ import sys
 import requests
 import subprocess
 import json
+import re
 import secrets
+import shlex
 import string
 from pathlib import Path
 from datetime import datetime
@@ -201,6 +203,356 @@ async def run_remote_migration(sftp_user, host_ip, backup_url):
         log_info(f"Remote migration failed with return code {process.returncode}")
         return False
 
+# Delta sync settings
+# Rocket.net sites are served from ~/public_html of the SFTP user
+ROCKET_WP_PATH = "public_html"
+# Folders under wp-content that are never worth syncing
+DELTA_SYNC_EXCLUDES = ("ai1wm-backups", "cache", "upgrade")
+# Core content tables (without prefix); options is left out so destination settings survive
+DELTA_SYNC_DEFAULT_TABLES = "posts,postmeta,comments,commentmeta,terms,termmeta,term_taxonomy,term_relationships,users,usermeta"
+# Max primary keys per dump/delete statement
+DELTA_SYNC_CHUNK_SIZE = 500
+
+def ssh_command(target, remote_cmd, compress=True):
+    cmd = ["ssh", "-o", "StrictHostKeyChecking=no"]
+    if compress:
+        cmd.append("-C")
+    # "--" keeps a target such as "-oProxyCommand=..." from being parsed as an option
+    return cmd + ["--", target, remote_cmd]
+
+def run_ssh(target, remote_cmd, input_data=None, allowed_codes=(0,)):
+    """Run a command over SSH and return its raw stdout."""
+    result = subprocess.run(
+        ssh_command(target, remote_cmd),
+        input=input_data,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+    if result.returncode not in allowed_codes:
+        error = result.stderr.decode('utf-8', errors='replace').strip()
+        raise RuntimeError(f"SSH command on {target} failed with return code {result.returncode}: {error}")
+    return result.stdout
+
+def wp_query(target, wp_path, sql):
+    """Run a SQL query with wp-cli and return the rows as lists of columns."""
+    remote_cmd = f"cd {shlex.quote(wp_path)} && wp db query {shlex.quote(sql)} --skip-column-names --batch"
+    output = run_ssh(target, remote_cmd).decode('utf-8', errors='replace')
+    return [line.split("\t") for line in output.splitlines() if line]
+
+def get_wp_value(target, wp_path, wp_args):
+    remote_cmd = f"cd {shlex.quote(wp_path)} && wp {wp_args} --skip-plugins --skip-themes"
+    return run_ssh(target, remote_cmd).decode('utf-8', errors='replace').strip()
+
+def get_file_manifest(target, wp_path):
+    """Return {path: (size, mtime)} for every file under wp-content."""
+    prunes = " -o ".join(f"-path ./{shlex.quote(name)}" for name in DELTA_SYNC_EXCLUDES)
+    remote_cmd = (
+        f"cd {shlex.quote(wp_path)}/wp-content && "
+        f"find . \\( {prunes} \\) -prune -o -type f -printf '%s\\t%T@\\t%P\\0'"
+    )
+    manifest = {}
+    for entry in run_ssh(target, remote_cmd).split(b"\0"):
+        if not entry:
+            continue
+        size, mtime, path = entry.decode('utf-8', errors='surrogateescape').split("\t", 2)
+        manifest[path] = (int(size), mtime)
+    return manifest
+
+def get_file_hashes(target, wp_path, paths):
+    """Return {path: md5} for the given paths under wp-content."""
+    if not paths:
+        return {}
+    remote_cmd = f"cd {shlex.quote(wp_path)}/wp-content && xargs -0 md5sum --"
+    file_list = b"\0".join(path.encode('utf-8', errors='surrogateescape') for path in paths)
+    hashes = {}
+    # Files can vanish on a live site after the manifest was taken: xargs then exits 123.
+    # Missing entries are simply re-sent, and tar skips them if they are really gone.
+    output = run_ssh(target, remote_cmd, input_data=file_list, allowed_codes=(0, 1, 123))
+    for line in output.decode('utf-8', errors='surrogateescape').splitlines():
+        # md5sum escapes unusual names with a leading backslash; those are simply re-sent
+        if line.startswith("\\"):
+            continue
+        digest, _, path = line.partition("  ")
+        hashes[path] = digest
+    return hashes
+
+def transfer_files(source, source_path, dest, dest_path, paths):
+    """Stream a compressed tar of the given wp-content paths from source to destination."""
+    sender = subprocess.Popen(
+        ssh_command(source, f"cd {shlex.quote(source_path)}/wp-content && tar --null --ignore-failed-read -czf - -T -", compress=False),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE
+    )
+    receiver = subprocess.Popen(
+        ssh_command(dest, f"cd {shlex.quote(dest_path)}/wp-content && tar -xzf -", compress=False),
+        stdin=sender.stdout
+    )
+    sender.stdout.close()
+    sender.stdin.write(b"\0".join(path.encode('utf-8', errors='surrogateescape') for path in paths))
+    sender.stdin.close()
+    receiver.wait()
+    sender.wait()
+    # GNU tar exits 1 when a file changed while being read; the next pass sends it again
+    if sender.returncode == 1:
+        log_info("Warning: Some files changed on the source while being sent, they will be picked up by the next pass.")
+    if sender.returncode not in (0, 1) or receiver.returncode != 0:
+        raise RuntimeError(f"File transfer failed (source: {sender.returncode}, destination: {receiver.returncode})")
+
+def delete_files(target, wp_path, paths):
+    if not paths:
+        return
+    remote_cmd = f"cd {shlex.quote(wp_path)}/wp-content && xargs -0 rm -f --"
+    run_ssh(target, remote_cmd, input_data=b"\0".join(path.encode('utf-8', errors='surrogateescape') for path in paths))
+
+def get_table_layout(target, wp_path, table):
+    """Return (primary_key_columns, columns) for a table."""
+    rows = wp_query(target, wp_path, (
+        "SELECT COLUMN_NAME, COLUMN_KEY FROM information_schema.COLUMNS "
+        f"WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = '{table}' ORDER BY ORDINAL_POSITION"
+    ))
+    columns = [row[0] for row in rows]
+    keys = [row[0] for row in rows if len(row) > 1 and row[1] == "PRI"]
+    return keys, columns
+
+def get_row_hashes(target, wp_path, table, keys, columns):
+    """Return {primary_key_values: md5} with one checksum per row, keyed by a tuple of the key columns."""
+    key_expr = ", ".join(f"`{key}`" for key in keys)
+    row_expr = ", ".join(f"IFNULL(`{column}`, 'NULL')" for column in columns)
+    rows = wp_query(target, wp_path, f"SELECT {key_expr}, MD5(CONCAT_WS('|', {row_expr})) FROM `{table}`")
+    return {tuple(row[:-1]): row[-1] for row in rows if len(row) == len(keys) + 1}
+
+def capture_source_snapshot(source, source_path, tables):
+    """Collect the file manifest and per-row checksums of the source site."""
+    prefix = get_wp_value(source, source_path, "config get table_prefix")
+    snapshot = {"prefix": prefix, "files": get_file_manifest(source, source_path), "tables": {}}
+    for name in tables:
+        table = prefix + name
+        keys, columns = get_table_layout(source, source_path, table)
+        if not columns:
+            log_info(f"Warning: Table '{table}' not found on source, skipping it.")
+            continue
+        if not keys:
+            log_info(f"Warning: Table '{table}' has no primary key, skipping it.")
+            continue
+        snapshot["tables"][name] = {
+            "keys": keys,
+            "rows": get_row_hashes(source, source_path, table, keys, columns)
+        }
+    return snapshot
+
+def sql_quote(value):
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+def sql_key_filter(keys, values):
+    """Build a WHERE condition matching the given primary key tuples, e.g. (`a`, `b`) IN (('1', '2'))."""
+    if len(keys) == 1:
+        return f"`{keys[0]}` IN ({', '.join(sql_quote(value[0]) for value in values)})"
+    key_expr = ", ".join(f"`{key}`" for key in keys)
+    value_expr = ", ".join("(" + ", ".join(sql_quote(part) for part in value) + ")" for value in values)
+    return f"({key_expr}) IN ({value_expr})"
+
+def sync_files(source, source_path, dest, dest_path, previous, current):
+    """Send files added or modified on the source since the previous snapshot."""
+    candidates = [path for path, meta in current.items() if previous.get(path) != meta]
+    deleted = [path for path in previous if path not in current]
+    dest_manifest = get_file_manifest(dest, dest_path)
+
+    # Same size on both sides: only send when the content really differs
+    same_size = [path for path in candidates if path in dest_manifest and dest_manifest[path][0] == current[path][0]]
+    source_hashes = get_file_hashes(source, source_path, same_size)
+    dest_hashes = get_file_hashes(dest, dest_path, same_size)
+    changed = [
+        path for path in candidates
+        if path not in source_hashes or source_hashes[path] != dest_hashes.get(path)
+    ]
+    deleted = [path for path in deleted if path in dest_manifest]
+
+    log_info(f"Files: {len(changed)} changed, {len(deleted)} deleted ({len(candidates) - len(changed)} already identical)")
+    if changed:
+        transfer_files(source, source_path, dest, dest_path, changed)
+    delete_files(dest, dest_path, deleted)
+    return len(changed) + len(deleted)
+
+def rename_dump_table(dump, source_table, target_table):
+    """Point the statements of a mysqldump at another table, leaving row data untouched."""
+    # mysqldump escapes newlines inside values, so statement headers are the only line starts
+    header = re.compile(rb"^(REPLACE INTO|INSERT INTO|LOCK TABLES|ALTER TABLE) `" + re.escape(source_table.encode()) + rb"`", re.MULTILINE)
+    return header.sub(lambda match: match.group(1) + b" `" + target_table.encode() + b"`", dump)
+
+def get_site_urls(source, source_path, dest, dest_path):
+    """Return the scheme-less home URLs of source and destination."""
+    source_home = get_wp_value(source, source_path, "option get home").split(":", 1)[-1]
+    dest_home = get_wp_value(dest, dest_path, "option get home").split(":", 1)[-1]
+    return source_home, dest_home
+
+def sync_rows(source, source_path, dest, dest_path, previous, current):
+    """Replay rows added, modified or deleted on the source since the previous snapshot."""
+    dest_prefix = get_wp_value(dest, dest_path, "config get table_prefix")
+    urls = None
+    total = 0
+    for name, table_info in current["tables"].items():
+        keys = table_info["keys"]
+        rows = table_info["rows"]
+        previous_rows = previous["tables"].get(name, {}).get("rows", {})
+        changed = [pk for pk, digest in rows.items() if previous_rows.get(pk) != digest]
+        deleted = [pk for pk in previous_rows if pk not in rows]
+        if not changed and not deleted:
+            continue
+
+        source_table = current["prefix"] + name
+        dest_table = dest_prefix + name
+        log_info(f"Table {dest_table}: {len(changed)} changed, {len(deleted)} deleted rows")
+
+        if changed:
+            if urls is None:
+                urls = get_site_urls(source, source_path, dest, dest_path)
+            replay_rows(source, source_path, dest, dest_path, source_table, dest_table, keys, changed, urls)
+
+        for i in range(0, len(deleted), DELTA_SYNC_CHUNK_SIZE):
+            chunk = deleted[i:i + DELTA_SYNC_CHUNK_SIZE]
+            wp_query(dest, dest_path, f"DELETE FROM `{dest_table}` WHERE {sql_key_filter(keys, chunk)}")
+
+        total += len(changed) + len(deleted)
+    return total
+
+def replay_rows(source, source_path, dest, dest_path, source_table, dest_table, keys, changed, urls):
+    """Copy changed rows through a scratch table so URL rewriting only scans the replayed rows."""
+    scratch_table = f"{dest_table}_delta_sync"
+    wp_query(dest, dest_path, f"DROP TABLE IF EXISTS `{scratch_table}`")
+    wp_query(dest, dest_path, f"CREATE TABLE `{scratch_table}` LIKE `{dest_table}`")
+    try:
+        for i in range(0, len(changed), DELTA_SYNC_CHUNK_SIZE):
+            chunk = changed[i:i + DELTA_SYNC_CHUNK_SIZE]
+            export_cmd = (
+                f"cd {shlex.quote(source_path)} && wp db export - --tables={source_table} "
+                "--no-create-info=true --replace=true --complete-insert=true --skip-triggers=true "
+                "--skip-add-locks=true --skip-disable-keys=true "
+                f"--where={shlex.quote(sql_key_filter(keys, chunk))}"
+            )
+            dump = rename_dump_table(run_ssh(source, export_cmd), source_table, scratch_table)
+            run_ssh(dest, f"cd {shlex.quote(dest_path)} && wp db import -", input_data=dump)
+
+        # Rewrite source URLs as the .wpress restore did for the full import
+        source_home, dest_home = urls
+        if source_home != dest_home:
+            remote_cmd = (
+                f"cd {shlex.quote(dest_path)} && wp search-replace {shlex.quote(source_home)} {shlex.quote(dest_home)} "
+                f"{scratch_table} --skip-columns=guid --skip-plugins --skip-themes"
+            )
+            run_ssh(dest, remote_cmd)
+
+        wp_query(dest, dest_path, f"REPLACE INTO `{dest_table}` SELECT * FROM `{scratch_table}`")
+    finally:
+        wp_query(dest, dest_path, f"DROP TABLE IF EXISTS `{scratch_table}`")
+
+def save_delta_state(state_path, source, source_path, dest, dest_path, snapshot):
+    """Persist the last synced snapshot so later runs can continue with --delta-only."""
+    state = {
+        "source": source,
+        "source_path": source_path,
+        "dest": dest,
+        "dest_path": dest_path,
+        "snapshot": {
+            "prefix": snapshot["prefix"],
+            "files": {path: list(meta) for path, meta in snapshot["files"].items()},
+            "tables": {
+                name: {"keys": info["keys"], "rows": [[list(pk), digest] for pk, digest in info["rows"].items()]}
+                for name, info in snapshot["tables"].items()
+            }
+        }
+    }
+    temp_path = f"{state_path}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(state, f)
+    os.replace(temp_path, state_path)
+
+def load_delta_state(state_path):
+    with open(state_path, 'r') as f:
+        state = json.load(f)
+    snapshot = state["snapshot"]
+    state["snapshot"] = {
+        "prefix": snapshot["prefix"],
+        "files": {path: tuple(meta) for path, meta in snapshot["files"].items()},
+        "tables": {
+            name: {"keys": info["keys"], "rows": {tuple(pk): digest for pk, digest in info["rows"]}}
+            for name, info in snapshot["tables"].items()
+        }
+    }
+    return state
+
+def run_delta_pass(source, source_path, dest, dest_path, previous, tables, current_pass, passes):
+    """Run one delta pass and return the source snapshot it synced."""
+    pass_start = time.time()
+    log_info(f"Delta pass {current_pass}/{passes}: scanning source...")
+    current = capture_source_snapshot(source, source_path, tables)
+    file_changes = sync_files(source, source_path, dest, dest_path, previous["files"], current["files"])
+    row_changes = sync_rows(source, source_path, dest, dest_path, previous, current)
+    if file_changes or row_changes:
+        get_wp_value(dest, dest_path, "cache flush")
+    log_info(f"Delta pass {current_pass}/{passes} done in {time.time() - pass_start:.2f} seconds "
+             f"({file_changes} files, {row_changes} rows)")
+    return current
+
+async def run_delta_sync(source, source_path, dest, dest_path, baseline, tables, passes,
+                         freeze=False, interval=0, state_path=None):
+    """Run incremental passes that bring the destination up to date with the source."""
+    log_info(f"Starting delta sync from {source} to {dest} ({passes} passes)...")
+    previous = baseline
+    for current_pass in range(1, passes + 1):
+        if current_pass > 1 and interval:
+            log_info(f"Waiting {interval}s before the next delta pass...")
+            await asyncio.sleep(interval)
+
+        frozen = freeze and current_pass == passes
+        if frozen:
+            log_info("Freezing source site (maintenance mode) for the final pass...")
+            get_wp_value(source, source_path, "maintenance-mode activate")
+
+        try:
+            previous = run_delta_pass(source, source_path, dest, dest_path, previous, tables, current_pass, passes)
+        except Exception:
+            if frozen:
+                # Never leave the source frozen behind an incomplete destination
+                log_info("Final delta pass failed: destination is incomplete, unfreezing source site...")
+                try:
+                    get_wp_value(source, source_path, "maintenance-mode deactivate")
+                    log_info("Source site is live again. Re-run the migration before switching DNS.")
+                except Exception as e:
+                    log_info(f"WARNING: Source site is STILL IN MAINTENANCE MODE ({str(e)}). "
+                             f"Run 'wp maintenance-mode deactivate' on {source} to bring it back.")
+            raise
+        if state_path:
+            save_delta_state(state_path, source, source_path, dest, dest_path, previous)
+
+    if freeze:
+        log_info("Source site left in maintenance mode. Point DNS to Rocket.net to complete the cutover.")
+    log_info("Delta sync completed successfully!")
+    if state_path and not freeze:
+        log_info(f"Run again with --delta-only --delta-state {state_path} to catch up before the cutover.")
+    return True
+
+async def run_delta_only(args, delta_tables):
+    """Continue a previous migration: run more delta passes against its existing destination."""
+    try:
+        state = load_delta_state(args.delta_state)
+    except (OSError, ValueError, KeyError) as e:
+        log_info(f"Could not load delta sync state from {args.delta_state}: {str(e)}")
+        return False
+    source = args.source_ssh or state["source"]
+    dest = args.dest_ssh or state["dest"]
+    if not dest:
+        log_info("No destination recorded in the delta sync state, use --dest-ssh. Exiting.")
+        return False
+    try:
+        return await run_delta_sync(
+            source, state["source_path"], dest, state["dest_path"],
+            state["snapshot"], delta_tables, args.delta_passes,
+            freeze=args.delta_freeze, interval=args.delta_interval, state_path=args.delta_state
+        )
+    except Exception as e:
+        log_info(f"Delta sync failed: {str(e)}")
+        return False
+
 async def wait_for_page_load(page, timeout=30):
     """Wait for page to be fully loaded."""
     try:
@@ -405,9 +757,9 @@ async def get_backup_url(page, admin_url):
 async def main_async(visual_mode=False):
     """Main async function."""
     parser = argparse.ArgumentParser(description="Get WordPress backup URL using All-in-One WP Migration")
-    parser.add_argument("--admin-url", required=True, help="WordPress admin URL (e.g., https://example.com/wp-admin)")
-    parser.add_argument("--username", required=True, help="WordPress admin username")
-    parser.add_argument("--password", required=True, help="WordPress admin password")
+    parser.add_argument("--admin-url", help="WordPress admin URL (e.g., https://example.com/wp-admin)")
+    parser.add_argument("--username", help="WordPress admin username")
+    parser.add_argument("--password", help="WordPress admin password")
     parser.add_argument("--visual", action="store_true", help="Run in visual mode (show browser window)")
     
     # Rocket.net arguments
@@ -420,14 +772,50 @@ async def main_async(visual_mode=False):
     parser.add_argument("--rocket-admin-email", help="Rocket.net admin email")
     parser.add_argument("--ssh-key-path", help="Path to your local SSH public key")
     
+    # Delta sync arguments
+    parser.add_argument("--source-ssh", help="SSH target of the source site (user@host), enables delta sync after the restore")
+    parser.add_argument("--source-path", default="public_html", help="WordPress root on the source, relative to the SSH home (default: public_html)")
+    parser.add_argument("--delta-passes", type=int, default=2, help="Number of delta sync passes after the restore (default: 2)")
+    parser.add_argument("--delta-tables", default=DELTA_SYNC_DEFAULT_TABLES, help="Comma-separated tables (without prefix) to replay during delta sync")
+    parser.add_argument("--delta-freeze", action="store_true", help="Put the source in maintenance mode before the final delta pass")
+    parser.add_argument("--delta-interval", type=int, default=120, help="Seconds to wait between delta passes (default: 120)")
+    parser.add_argument("--delta-state", help="File keeping the last synced source snapshot (default: delta-sync-<source>.json)")
+    parser.add_argument("--delta-only", action="store_true", help="Skip the export and restore, run delta passes from --delta-state against the existing destination")
+    parser.add_argument("--dest-ssh", help="SSH target of the destination (user@host) for --delta-only, overrides the one in --delta-state")
+    
     args = parser.parse_args()
     
+    if not args.delta_only and not (args.admin_url and args.username and args.password):
+        parser.error("--admin-url, --username and --password are required unless --delta-only is used")
+    delta_tables = [name.strip() for name in args.delta_tables.split(",") if name.strip()]
+    invalid_tables = [name for name in delta_tables if not re.match(r"^[A-Za-z0-9_]+$", name)]
+    if invalid_tables:
+        parser.error(f"invalid --delta-tables names: {', '.join(invalid_tables)}")
+    if args.delta_passes < 0:
+        parser.error("--delta-passes must be 0 or greater")
+    if args.delta_interval < 0:
+        parser.error("--delta-interval must be 0 or greater")
+    for option, target in (("--source-ssh", args.source_ssh), ("--dest-ssh", args.dest_ssh)):
+        if target is not None and (not target or target.startswith("-") or re.search(r"\s", target)):
+            parser.error(f"invalid {option} target: {target!r}")
+    if args.delta_only and not (args.delta_state or args.source_ssh):
+        parser.error("--delta-only needs --delta-state or --source-ssh to find the saved state")
+    if not args.delta_state and args.source_ssh:
+        args.delta_state = "delta-sync-" + re.sub(r"[^A-Za-z0-9_.-]", "_", args.source_ssh) + ".json"
+    
+    if args.delta_only:
+        delta_start = time.time()
+        await run_delta_only(args, delta_tables)
+        log_info(f"Delta sync time: {time.time() - delta_start:.2f} seconds")
+        return
+    
     # Initialize timing statistics
     start_time = time.time()
     stats = {
         'login': 0,
         'plugin_installation': 0,
         'export': 0,
+        'delta_sync': 0,
         'total': 0
     }
     
@@ -465,7 +853,21 @@ async def main_async(visual_mode=False):
         
         stats['plugin_installation'] = time.time() - plugin_start
         
-        # Step 3: Get backup URL
+        # Step 3: Snapshot the source so changes made during and after the export can be replayed
+        # Only worth it when a Rocket.net migration will actually run afterwards
+        rocket_token = args.rocket_token or os.environ.get("ROCKET_NET_TOKEN")
+        baseline = None
+        if (args.source_ssh and args.delta_passes > 0 and rocket_token and args.rocket_name
+                and get_ssh_key(args.ssh_key_path)[0]):
+            log_info(f"Capturing source baseline for delta sync via {args.source_ssh}...")
+            baseline_start = time.time()
+            try:
+                baseline = capture_source_snapshot(args.source_ssh, args.source_path, delta_tables)
+            except Exception as e:
+                log_info(f"Warning: Could not capture source baseline, delta sync disabled: {str(e)}")
+            stats['delta_sync'] += time.time() - baseline_start
+        
+        # Step 4: Get backup URL
         export_start = time.time()
         backup_url = await get_backup_url(page, admin_url)
         stats['export'] = time.time() - export_start
@@ -475,7 +877,6 @@ async def main_async(visual_mode=False):
             log_info(f"wget -c {backup_url}")
             
             # Check if Rocket.net migration is requested
-            rocket_token = args.rocket_token or os.environ.get("ROCKET_NET_TOKEN")
             if rocket_token and args.rocket_name:
                 log_info("\n" + "="*50)
                 log_info("STARTING ROCKET.NET MIGRATION")
@@ -533,7 +934,26 @@ async def main_async(visual_mode=False):
                         time.sleep(10)
                         
                         # 8, 9, 10. Run remote migration
-                        await run_remote_migration(sftp_user, host_ip, backup_url)
+                        migrated = await run_remote_migration(sftp_user, host_ip, backup_url)
+                        
+                        # 11. Catch up with changes made on the source since the export
+                        if migrated and baseline:
+                            delta_start = time.time()
+                            dest = f"{sftp_user}@{host_ip}"
+                            try:
+                                # Record the destination first so --delta-only can resume even if a pass fails
+                                save_delta_state(args.delta_state, args.source_ssh, args.source_path,
+                                                 dest, ROCKET_WP_PATH, baseline)
+                                await run_delta_sync(
+                                    args.source_ssh, args.source_path,
+                                    dest, ROCKET_WP_PATH,
+                                    baseline, delta_tables, args.delta_passes,
+                                    freeze=args.delta_freeze, interval=args.delta_interval,
+                                    state_path=args.delta_state
+                                )
+                            except Exception as e:
+                                log_info(f"Delta sync failed: {str(e)}")
+                            stats['delta_sync'] += time.time() - delta_start
                     else:
                         log_info("Warning: No SSH public key found. Skipping remote migration steps.")
                         log_info(f"You can manually migration by connecting to {sftp_user}@{host_ip}")
@@ -560,6 +980,8 @@ async def main_async(visual_mode=False):
     print(f"Login time: {stats['login']:.2f} seconds")
     print(f"Plugin installation time: {stats['plugin_installation']:.2f} seconds")
     print(f"Export time: {stats['export']:.2f} seconds")
+    if stats['delta_sync']:
+        print(f"Delta sync time: {stats['delta_sync']:.2f} seconds")
     print("-"*50)
     print(f"Total execution time: {stats['total']:.2f} seconds")
     print("="*50 + "\n")
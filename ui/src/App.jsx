@@ -13,6 +13,11 @@ const App = () => {
         rocketName: '',
         rocketLocation: 21,
         rocketLabel: '',
+        sourceSsh: '',
+        sourcePath: 'public_html',
+        deltaPasses: 2,
+        deltaInterval: 120,
+        deltaFreeze: false,
         visual: false
     });
 
@@ -118,6 +123,58 @@ const App = () => {
                                     />
                                 </div>
                             </div>
+                            <div className="input-row">
+                                <div className="input-group">
+                                    <label>Source SSH (optional, enables delta sync)</label>
+                                    <input
+                                        name="sourceSsh"
+                                        placeholder="user@203.0.113.10"
+                                        value={formData.sourceSsh}
+                                        onChange={handleChange}
+                                    />
+                                </div>
+                                <div className="input-group">
+                                    <label>Source WordPress Path</label>
+                                    <input
+                                        name="sourcePath"
+                                        value={formData.sourcePath}
+                                        onChange={handleChange}
+                                    />
+                                </div>
+                            </div>
+                            {formData.sourceSsh && (
+                                <div className="input-row">
+                                    <div className="input-group">
+                                        <label>Delta Sync Passes</label>
+                                        <input
+                                            type="number"
+                                            min={0}
+                                            name="deltaPasses"
+                                            value={formData.deltaPasses}
+                                            onChange={handleChange}
+                                        />
+                                    </div>
+                                    <div className="input-group">
+                                        <label>Seconds Between Passes</label>
+                                        <input
+                                            type="number"
+                                            min={0}
+                                            name="deltaInterval"
+                                            value={formData.deltaInterval}
+                                            onChange={handleChange}
+                                        />
+                                    </div>
+                                    <label className="checkbox-label">
+                                        <input
+                                            type="checkbox"
+                                            name="deltaFreeze"
+                                            checked={formData.deltaFreeze}
+                                            onChange={handleChange}
+                                        />
+                                        Freeze source before final pass
+                                    </label>
+                                </div>
+                            )}
                             <button className="primary-btn" onClick={() => setStep(2)}>
                                 Next Step <ChevronRight size={18} />
                             </button>
@@ -274,6 +331,13 @@ const App = () => {
           color: var(--text-muted);
           font-weight: 500;
         }
+        .checkbox-label {
+          display: flex;
+          align-items: center;
+          gap: 0.5rem;
+          align-self: end;
+          padding-bottom: 0.8rem;
+        }
         input, select {
           background: rgba(15, 23, 42, 0.5);
           border: 1px solid var(--border);